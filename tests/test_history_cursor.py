@@ -0,0 +1,28 @@
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+import pingdaddypro
+
+
+def test_cursor_round_trip():
+    timestamp = datetime(2026, 10, 18, 7, 30, 15, 123456)
+    
+    cursor = pingdaddypro.encode_history_cursor(timestamp, 987654)
+    
+    assert '=' not in cursor
+    assert pingdaddypro.decode_history_cursor(cursor) == (timestamp, 987654)
+
+
+def test_cursor_stores_aware_timestamps_as_utc():
+    timestamp = datetime(2026, 10, 18, 9, 30, tzinfo=timezone(timedelta(hours=2)))
+    
+    cursor = pingdaddypro.encode_history_cursor(timestamp, 1)
+    
+    assert pingdaddypro.decode_history_cursor(cursor) == (datetime(2026, 10, 18, 7, 30), 1)
+
+
+@pytest.mark.parametrize('cursor', ['', 'not a cursor', '!!!', 'MjAyNi0xMC0xOA', 'eHx5'])
+def test_invalid_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        pingdaddypro.decode_history_cursor(cursor)
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import pingdaddypro
+
+
+class PartitionCursor:
+    """Cursor stand-in serving pg_inherits / pg_class lookups from a list of (name, lower, upper)"""
+    
+    def __init__(self, partitions):
+        self.partitions = list(partitions)
+        self.dropped = []
+        self.result = []
+    
+    def execute(self, query, params=None):
+        if 'relkind' in query:
+            self.result = [{'relkind': 'p'}]
+        elif 'pg_inherits' in query:
+            self.result = [{'name': name, 'bound': "FOR VALUES FROM (%s) TO ('%s')" % (
+                'MINVALUE' if lower is None else f"'{lower}'", upper)}
+                for name, lower, upper in self.partitions]
+        elif 'PARTITION OF' in query:
+            self.partitions.append((query.split()[5], *params))
+        elif 'DETACH PARTITION' in query:
+            name = query.split()[-1]
+            self.partitions = [partition for partition in self.partitions if partition[0] != name]
+        elif query.startswith('DROP TABLE'):
+            self.dropped.append(query.split()[-1])
+        else:
+            raise AssertionError(query)
+    
+    def fetchone(self):
+        return self.result[0] if self.result else None
+    
+    def fetchall(self):
+        return self.result
+
+
+def daily(first, last):
+    day = first
+    while day <= last:
+        yield (f"performance_data_p{day:%Y%m%d}", day, day + timedelta(days=1))
+        day += timedelta(days=1)
+
+
+def covered(partitions, moment):
+    return [name for name, lower, upper in partitions if (lower is None or lower <= moment) and moment < upper]
+
+
+@pytest.fixture
+def weekly(monkeypatch):
+    monkeypatch.setattr(pingdaddypro, 'PARTITION_INTERVAL', 'week')
+
+
+def test_missing_partition_range_fills_a_whole_period():
+    assert pingdaddypro.missing_partition_range([], datetime(2026, 10, 17, 13)) == (
+        datetime(2026, 10, 17), datetime(2026, 10, 18))
+
+
+def test_missing_partition_range_is_none_when_covered():
+    partitions = list(daily(datetime(2026, 10, 1), datetime(2026, 10, 3)))
+    assert pingdaddypro.missing_partition_range(partitions, datetime(2026, 10, 2, 23, 59)) is None
+    assert pingdaddypro.missing_partition_range(
+        [('legacy', None, datetime(2026, 10, 1))], datetime(2020, 1, 1)) is None
+
+
+def test_missing_partition_range_stops_at_next_partition(weekly):
+    partitions = [('performance_data_p20261021', datetime(2026, 10, 21), datetime(2026, 10, 22))]
+    assert pingdaddypro.missing_partition_range(partitions, datetime(2026, 10, 20, 6)) == (
+        datetime(2026, 10, 19), datetime(2026, 10, 21))
+
+
+def test_interval_change_from_day_to_week_leaves_no_gap(weekly):
+    cursor = PartitionCursor(daily(datetime(2026, 10, 1), datetime(2026, 10, 16)))
+    created = pingdaddypro.ensure_time_partitions(cursor, 'performance_data', now=datetime(2026, 10, 8))
+    
+    assert created[0] == 'performance_data_p20261017'
+    assert ('performance_data_p20261017', datetime(2026, 10, 17), datetime(2026, 10, 19)) in cursor.partitions
+    moment = datetime(2026, 10, 8)
+    while moment < datetime(2026, 11, 30):  # Monday of the week of now + PARTITION_PREMAKE + 1 weeks
+        assert len(covered(cursor.partitions, moment)) == 1, moment
+        moment += timedelta(hours=6)
+
+
+def test_ensure_partitions_for_fills_gap_after_interval_change(weekly):
+    partitions = list(daily(datetime(2026, 10, 1), datetime(2026, 10, 16)))
+    partitions.append(('performance_data_p20261019', datetime(2026, 10, 19), datetime(2026, 10, 26)))
+    cursor = PartitionCursor(partitions)
+    
+    created = pingdaddypro.ensure_partitions_for(
+        cursor, 'performance_data', [datetime(2026, 10, 17, 12), datetime(2026, 10, 18, 3)])
+    
+    assert created == ['performance_data_p20261017']
+    assert cursor.partitions[-1] == ('performance_data_p20261017', datetime(2026, 10, 17), datetime(2026, 10, 19))
+
+
+def test_far_future_partition_does_not_stop_premake():
+    cursor = PartitionCursor(daily(datetime(2026, 10, 1), datetime(2026, 10, 8)))
+    pingdaddypro.ensure_partitions_for(cursor, 'performance_data', [datetime(2027, 6, 1, 12)])
+    created = pingdaddypro.ensure_time_partitions(cursor, 'performance_data', now=datetime(2026, 10, 8, 12))
+    
+    assert created == [f"performance_data_p{datetime(2026, 10, 9) + timedelta(days=day):%Y%m%d}"
+                       for day in range(pingdaddypro.PARTITION_PREMAKE)]
+
+
+def legacy_and_daily():
+    partitions = [('performance_data_legacy', None, datetime(2026, 10, 3))]
+    return partitions + list(daily(datetime(2026, 10, 3), datetime(2026, 10, 6)))
+
+
+def test_drop_expired_partitions_drops_whole_expired_partitions():
+    cursor = PartitionCursor(legacy_and_daily())
+    
+    dropped, partial = pingdaddypro.drop_expired_partitions(cursor, 'performance_data', datetime(2026, 10, 4, 12))
+    
+    assert dropped == cursor.dropped == ['performance_data_legacy', 'performance_data_p20261003']
+    assert partial == []
+    assert [name for name, _, _ in cursor.partitions] == [
+        'performance_data_p20261004', 'performance_data_p20261005', 'performance_data_p20261006']
+
+
+def test_drop_expired_partitions_reports_partly_expired_legacy_partition():
+    cursor = PartitionCursor(legacy_and_daily())
+    
+    dropped, partial = pingdaddypro.drop_expired_partitions(cursor, 'performance_data', datetime(2026, 10, 2))
+    
+    assert dropped == []
+    assert partial == ['performance_data_legacy']
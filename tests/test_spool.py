@@ -0,0 +1,102 @@
+import os
+from datetime import datetime, timedelta
+
+import psycopg2
+import pytest
+
+import pingdaddypro
+
+START = datetime(2026, 10, 18, 12, 0)
+
+
+def sample(index, table='performance_data'):
+    return (table, (START + timedelta(seconds=index), 'https://example.com/', 'Online', 100 + index, None))
+
+
+@pytest.fixture
+def spool(tmp_path):
+    return pingdaddypro.SampleSpool(str(tmp_path / 'spool'), segment_bytes=1024, fsync_interval=0)
+
+
+def replay_all(spool, batch_size=3, max_batches=None):
+    written = []
+    while spool.pending:
+        spool.replay(lambda batch: written.extend(batch), batch_size, max_batches)
+    return written
+
+
+def test_replay_returns_rows_in_order_across_segments(spool):
+    batches = [[sample(index) for index in range(start, start + 10)] for start in range(0, 50, 10)]
+    for batch in batches:
+        spool.append(batch)
+    
+    assert len(spool.scan()) > 1
+    assert replay_all(spool) == [item for batch in batches for item in batch]
+    assert not spool.pending
+    assert os.listdir(spool.directory) == []
+
+
+def test_oldest_timestamp_follows_the_replay(spool):
+    assert spool.oldest_timestamp() is None
+    spool.append([sample(index) for index in range(6)])
+    assert spool.oldest_timestamp() == START
+    
+    spool.replay(lambda batch: None, 2, max_batches=2)
+    assert spool.oldest_timestamp() == START + timedelta(seconds=4)
+
+
+def test_max_batches_bounds_one_replay_call(spool):
+    spool.append([sample(index) for index in range(7)])
+    written = []
+    
+    assert spool.replay(written.extend, 2, max_batches=2) == 4
+    assert spool.pending
+    assert spool.replay(written.extend, 2, max_batches=2) == 3
+    spool.replay(written.extend, 2, max_batches=2)
+    
+    assert written == [sample(index) for index in range(7)]
+    assert not spool.pending
+
+
+def test_restart_resumes_at_the_recorded_offset(spool):
+    spool.append([sample(index) for index in range(6)])
+    spool.replay(lambda batch: None, 2, max_batches=1)
+    spool.close()
+    
+    restarted = pingdaddypro.SampleSpool(spool.directory)
+    assert replay_all(restarted, batch_size=2) == [sample(index) for index in range(2, 6)]
+
+
+def test_connection_error_keeps_the_batch_for_the_next_attempt(spool):
+    spool.append([sample(index) for index in range(4)])
+    
+    def unavailable(batch):
+        raise psycopg2.OperationalError('server closed the connection')
+    
+    with pytest.raises(psycopg2.OperationalError):
+        spool.replay(unavailable, 2)
+    assert replay_all(spool, batch_size=2) == [sample(index) for index in range(4)]
+
+
+def test_rejected_batch_is_skipped(spool):
+    spool.append([sample(index) for index in range(4)])
+    written = []
+    
+    def reject_first(batch):
+        if batch[0] == sample(0):
+            raise ValueError('bad row')
+        written.extend(batch)
+    
+    spool.replay(reject_first, 2)
+    assert written == [sample(2), sample(3)]
+    assert spool.get_stats()['skipped'] == 2
+
+
+def test_torn_line_is_skipped(spool):
+    spool.append([sample(0)])
+    spool.file.write('["performance_data", "2026-10-')  # Crash in the middle of an append
+    spool.close()
+    spool.append([sample(1)])
+    
+    assert replay_all(spool) == [sample(0), sample(1)]
+    assert spool.get_stats()['skipped'] == 1
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+import pingdaddypro
+
+
+class BatchCursor:
+    """Named-cursor stand-in returning ``rows`` through fetchmany()"""
+    
+    def __init__(self, rows, fetches):
+        self.rows = list(rows)
+        self.fetches = fetches
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def execute(self, query, params=None):
+        pass
+    
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        self.fetches.append(len(batch))
+        return batch
+
+
+class BatchConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.fetches = []
+    
+    def cursor(self, name=None, cursor_factory=None):
+        assert name, 'fetch_array must use a server-side cursor'
+        return BatchCursor(self.rows, self.fetches)
+
+
+def test_fetch_array_concatenates_batches():
+    rows = [(index, index * 1.5, index % 3) for index in range(10)]
+    conn = BatchConnection(rows)
+    
+    array = pingdaddypro.fetch_array(conn, 'SELECT ...', (), 3, batch_size=4)
+    
+    assert conn.fetches == [4, 4, 2, 0]
+    assert array.shape == (10, 3)
+    np.testing.assert_array_equal(array, np.array(rows, dtype=np.float64))
+
+
+def test_fetch_array_without_rows_keeps_the_column_count():
+    assert pingdaddypro.fetch_array(BatchConnection([]), 'SELECT ...', (), 4).shape == (0, 4)
+
+
+def test_grouped_stats_match_numpy_per_group():
+    rng = np.random.default_rng(7)
+    groups = rng.integers(0, 4, 500)
+    values = rng.integers(20, 2000, 500).astype(np.float64)
+    
+    stats = pingdaddypro.grouped_response_time_stats(groups, values, np.ones(500), 5, bins=10)
+    
+    for group in range(4):
+        member = values[groups == group]
+        assert stats['checks'][group] == member.size
+        assert stats['min'][group] == member.min()
+        assert stats['max'][group] == member.max()
+        assert stats['mean'][group] == pytest.approx(member.mean())
+        assert stats['std'][group] == pytest.approx(member.std())
+        for q in pingdaddypro.STATS_PERCENTILES:
+            assert stats['percentiles'][q][group] == np.percentile(member, q, method='inverted_cdf')
+        assert stats['histogram'][group].sum() == member.size
+    assert stats['checks'][4] == 0
+
+
+def test_weights_count_like_repeated_values():
+    values = np.array([100, 300, 200, 900], dtype=np.float64)
+    weights = np.array([3, 1, 5, 1], dtype=np.float64)
+    
+    weighted = pingdaddypro.grouped_response_time_stats(np.zeros(4), values, weights, 1, bins=4)
+    repeated = np.repeat(values, weights.astype(int))
+    
+    assert weighted['checks'][0] == repeated.size
+    assert weighted['mean'][0] == pytest.approx(repeated.mean())
+    for q in pingdaddypro.STATS_PERCENTILES:
+        assert weighted['percentiles'][q][0] == np.percentile(repeated, q, method='inverted_cdf')
+    assert weighted['histogram'][0].sum() == repeated.size
+
+
+def test_grouped_stats_without_values():
+    stats = pingdaddypro.grouped_response_time_stats([], [], [], 2, bins=3)
+    
+    assert stats['checks'].tolist() == [0, 0]
+    assert stats['histogram'].shape == (2, 3)